@@ -1,18 +1,21 @@
 import os
-import subprocess
 import sys
 import time
 import logging
 import json
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
 import schedule
 
-print("Starting application...")
+from cli import run_enrollment
+
 def setup_logging():
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler("app.log"),
+            # Bounded like the loguru sink in base.py, app.py runs indefinitely
+            RotatingFileHandler("app.log", maxBytes=10 * 1024 * 1024, backupCount=1),
             logging.StreamHandler()
         ]
     )
@@ -23,19 +26,20 @@ def setup_logging():
     logging.info("Current working directory: %s", os.getcwd())
     #logging.info("Environment variables: %s", json.dumps(dict(os.environ), indent=2))
 
-def run_command(command):
-    logging.info("Running command: %s", command)
-    try:
-        result = subprocess.run(command, shell=True, check=True, text=True, stdout=sys.stdout, stderr=sys.stderr)
-        logging.info("Command completed successfully.")
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        logging.error("Command failed with error: %s", e)
-        raise e
-
 def job():
     logging.info("Scheduled job started.")
-    run_command("python cli.py")
+    # Runs in this process, so imports and settings parsing are paid once, not every run.
+    # A failed run must not take the scheduler down with it.
+    try:
+        run_enrollment()
+    except SystemExit as e:
+        # cli.py exits on fatal errors, which ends this run only
+        if e.code:
+            logging.error("Scheduled job failed with exit code %s, will retry at the next run.", e.code)
+            return
+    except Exception:
+        logging.exception("Scheduled job failed, will retry at the next run.")
+        return
     logging.info("Scheduled job finished.")
 
 def main():
@@ -50,8 +54,16 @@ def main():
     schedule.every(4).hours.do(job)
     logging.info("Scheduler started. Next job run is in 4 hours, then every 4 hours thereafter.")
     while True:
+        # Sleep until the next job is due instead of polling. schedule.idle_seconds()
+        # would scan the job list twice, next_run() scans it once
+        next_run = schedule.next_run()
+        if next_run is None:
+            break  # Nothing left to schedule
+        idle = (next_run - datetime.now()).total_seconds()
+        if idle > 0:
+            # Capped so a clock jump (e.g. resume from suspend) is noticed within the hour
+            time.sleep(min(idle, 3600))
         schedule.run_pending()
-        time.sleep(1)
 
 
 if __name__ == "__main__":
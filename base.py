@@ -1,20 +1,24 @@
-import concurrent
-import inspect
+import concurrent.futures
+import copy
 import json
 import os
 import random
 import pickle
+import queue
 import re
 import sys
 import threading
 import time
 import traceback
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import partial
 from html import unescape
 from urllib.parse import parse_qs, unquote, urlparse, urlsplit, urlunparse
 
 import cloudscraper
+import orjson
 import requests
 import rookiepy 
 from bs4 import BeautifulSoup as bs
@@ -38,8 +42,9 @@ log_file_path = "duce.log"
 
 
 logger.remove()
-logger.add(log_file_path, rotation="10 MB", level="INFO", mode="w")
-logger.info(f"Program started - {VERSION}")
+# enqueue: callers only put records on a queue, a single worker thread writes them
+logger.add(log_file_path, rotation="10 MB", level="INFO", mode="w", enqueue=True)
+logger.info("Program started - {}", VERSION)
 
 scraper_dict: dict = {
     "Real Discount": "rd",
@@ -52,6 +57,7 @@ scraper_dict: dict = {
     "Course Joiner": "cj",
     "Course Vania": "cv",
 }
+_ALL_SITE_KEYS = frozenset(scraper_dict)
 
 LINKS = {
     "github": "https://github.com/techtanic/Discounted-Udemy-Course-Enroller",
@@ -76,6 +82,64 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+# Last parsed settings file, keyed by (path, mtime_ns)
+_settings_cache = {"key": None, "value": None}
+
+
+def read_settings_file(path: str) -> dict:
+    """Parse a settings file, reusing the previous result while the file is unchanged
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    key = (path, os.stat(path).st_mtime_ns)
+    if _settings_cache["key"] != key:
+        with open(path, "rb") as f:
+            _settings_cache["value"] = orjson.loads(f.read())
+        _settings_cache["key"] = key
+    return copy.deepcopy(_settings_cache["value"])
+
+
+# Latest release tag and the ETag GitHub served it with, for conditional requests
+_release_cache = {"etag": None, "tag": None}
+
+
+def get_latest_release_tag() -> str:
+    """Tag name of the latest GitHub release
+
+    Repeat checks send If-None-Match, so an unchanged release comes back as an empty
+    304 that doesn't count against GitHub's rate limit.
+    """
+    headers = {}
+    if _release_cache["etag"]:
+        headers["If-None-Match"] = _release_cache["etag"]
+    r = requests.get(
+        "https://api.github.com/repos/techtanic/Discounted-Udemy-Course-Enroller/releases/latest",
+        headers=headers,
+    )
+    if r.status_code != 304:
+        _release_cache["tag"] = r.json()["tag_name"]
+        _release_cache["etag"] = r.headers.get("ETag")
+    return _release_cache["tag"]
+
+
+# Shared by every session validation in the process
+_session_scraper = None
+
+
+def get_session_scraper() -> cloudscraper.CloudScraper:
+    """Return the process wide CloudScraper with its cookie jar emptied
+
+    Building one resolves a browser profile and a TLS context, which is not worth
+    repeating for every login attempt.
+    """
+    global _session_scraper
+    if _session_scraper is None:
+        _session_scraper = cloudscraper.CloudScraper()
+    _session_scraper.cookies.clear()
+    return _session_scraper
+
+
 class Course:
     def __init__(self, title: str, url: str, site: str = None):
         self.title = title
@@ -135,9 +199,9 @@ class Course:
         elif len(path_parts) > 1:
             slug = path_parts[1]
         else:
-            logger.error(f"Invalid URL format: {self.url}")
+            logger.error("Invalid URL format: {}", self.url)
             slug = None
-        logger.debug(f"Course slug: {slug}")
+        logger.debug("Course slug: {}", slug)
         self.slug = slug
 
     def extract_coupon_code(self):
@@ -186,6 +250,17 @@ class Course:
         return hash(self.url)
 
 
+@dataclass
+class SiteState:
+    """Progress and results of one site's scraper"""
+
+    length: int = 0
+    progress: int = 0
+    done: bool = False
+    error: str = ""
+    data: list = field(default_factory=list)
+
+
 class Scraper:
     """
     Scrapers: RD,TB, CV, IDC, EN, DU, UF
@@ -198,43 +273,63 @@ class Scraper:
     ):
         self.sites = site_to_scrape
         self.debug = debug
-        for site in self.sites:
-            code_name = scraper_dict[site]
-            setattr(self, f"{code_name}_length", 0)
-            setattr(self, f"{code_name}_data", [])
-            setattr(self, f"{code_name}_done", False)
-            setattr(self, f"{code_name}_progress", 0)
-            setattr(self, f"{code_name}_error", "")
+        # (site_code, attr, value) updates from every scraper, read by get_scraped_courses
+        self.updates = queue.Queue()
+        self.site_names = {scraper_dict[site]: site for site in self.sites}
+        # Keyed by code name, which is also the name of the site's scraper method
+        self.site_states = {code_name: SiteState() for code_name in self.site_names}
 
     def get_scraped_courses(self, target: object) -> dict:
-        logger.info(f"Starting scrape for sites: {self.sites}")
-        threads = []
+        """Run every site's scraper on a shared pool and report their progress to target
+
+        target(site, attr, value) is called from the calling thread only, with attr being
+        "length", "progress" or "done". Bursts of updates are coalesced to the latest value.
+        """
+        logger.info("Starting scrape for sites: {}", self.sites)
         scraped_data = set()
-        for site in self.sites:
-            logger.info(f"Scraping site: {site}")
-            t = threading.Thread(
-                target=target,
-                args=(site,),
-                daemon=True,
-            )
-            t.start()
-            threads.append(t)
-            time.sleep(0.2)
-        for t in threads:
-            t.join()
+        remaining = set(self.sites)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.sites), thread_name_prefix="scrape"
+        ) as executor:
+            for site in self.sites:
+                logger.info("Scraping site: {}", site)
+                code_name = scraper_dict[site]
+                future = executor.submit(getattr(self, code_name))
+                future.add_done_callback(partial(self.finalize, code_name))
+
+            while remaining:
+                site_code, attr, value = self.updates.get()
+                latest = {(site_code, attr): value}
+                while True:
+                    try:
+                        site_code, attr, value = self.updates.get_nowait()
+                    except queue.Empty:
+                        break
+                    latest[(site_code, attr)] = value
+                for kind in ("length", "progress", "done"):
+                    for (site_code, attr), value in latest.items():
+                        site = self.site_names[site_code]
+                        if attr != kind or site not in remaining:
+                            continue
+                        try:
+                            target(site, attr, value)
+                        except Exception:
+                            logger.exception("Error reporting progress of {}", site)
+                        if attr == "done":
+                            remaining.discard(site)
         logger.info("All scraping threads completed, combining results")
         for site in self.sites:
-            courses: list[Course] = getattr(self, f"{scraper_dict[site]}_data")
+            courses: list[Course] = self.site_states[scraper_dict[site]].data
 
             for course in courses:
                 course.site = site
                 scraped_data.add(course)
 
-        logger.info(f"Scraping finished. Found {len(scraped_data)} unique courses.")
+        logger.info("Scraping finished. Found {} unique courses.", len(scraped_data))
         return list(scraped_data)
 
     def append_to_list(self, title: str, link: str):
-        target = getattr(self, f"{inspect.stack()[1].function}_data")
+        target = self.site_states[sys._getframe(1).f_code.co_name].data
         course = Course(title, link)
         target.append(course)
 
@@ -245,16 +340,36 @@ class Scraper:
         return bs(content, "lxml")
 
     def set_attr(self, attr: str, value):
-        site_code = inspect.stack()[1].function
-        setattr(self, f"{site_code}_{attr}", value)
+        site_code = sys._getframe(1).f_code.co_name
+        setattr(self.site_states[site_code], attr, value)
+        self.signal(site_code, attr, value)
+
+    def signal(self, site_code: str, attr: str, value):
+        """Queue a length/progress/done update for get_scraped_courses"""
+        if attr in ("length", "progress", "done"):
+            self.updates.put_nowait((site_code, attr, value))
+
+    def finalize(self, site_code: str, future: concurrent.futures.Future):
+        """Mark a site as done once its scraper returns, recording the error if it raised"""
+        state = self.site_states[site_code]
+        error = future.exception()
+        if error is not None and not state.error:
+            state.error = "".join(
+                traceback.format_exception(type(error), error, error.__traceback__)
+            )
+            state.length = -1
+        # Repeated "done" updates are ignored by get_scraped_courses
+        state.done = True
+        self.signal(site_code, "done", True)
 
     def handle_exception(self):
-        logger.exception("An error occurred")
-        site_code = inspect.stack()[1].function
+        site_code = sys._getframe(1).f_code.co_name
         error_trace = traceback.format_exc()
-        setattr(self, f"{site_code}_error", error_trace)
-        setattr(self, f"{site_code}_length", -1)
-        setattr(self, f"{site_code}_done", True)
+        logger.error("An error occurred in {}\n{}", site_code, error_trace)
+        state = self.site_states[site_code]
+        state.error = error_trace
+        state.length = -1
+        state.done = True
 
     def cleanup_link(self, link: str) -> str:
         parsed_url = urlparse(link)
@@ -270,7 +385,7 @@ class Scraper:
             elif "murl" in query_params:
                 return unquote(query_params["murl"][0])
             else:
-                logger.error(f"Unknown link format: {link}")
+                logger.error("Unknown link format: {}", link)
                 return ""
 
         raise ValueError(f"Unknown link format: {link}")
@@ -379,7 +494,7 @@ class Scraper:
                         link = self.cleanup_link(link)
                         self.append_to_list(title, link)
                     else:
-                        logger.error(f"Unknown link format: {link}")
+                        logger.error("Unknown link format: {}", link)
                     self.set_attr("progress", i + 1)
         except:
             self.handle_exception()
@@ -462,7 +577,7 @@ class Scraper:
                 nonce = re.search(
                     r"load_content\"\:\"(.*?)\"", content.decode("utf-8"), re.DOTALL
                 ).group(1)
-                logger.debug(f"Nonce: {nonce}")
+                logger.debug("Nonce: {}", nonce)
             except IndexError:
                 self.set_attr("error", "Nonce not found")
                 self.set_attr("length", -1)
@@ -503,7 +618,7 @@ class Scraper:
                         link = self.cleanup_link(link)
                         self.append_to_list(title, link)
                     else:
-                        logger.error(f"Unknown link format: {link}")
+                        logger.error("Unknown link format: {}", link)
                     self.set_attr("progress", i + 1)
         except:
             self.handle_exception()
@@ -693,15 +808,15 @@ class Scraper:
                     try:
                         response = future.result()
                         if response.status_code != 200:
-                            logger.error(f"Request failed with status code {response.status_code}")
+                            logger.error("Request failed with status code {}", response.status_code)
                             continue
 
                         content = response.json().get("coupons", [])
                     except requests.exceptions.JSONDecodeError:
-                        logger.error(f"Failed to decode JSON from response: {response.text}")
+                        logger.error("Failed to decode JSON from response: {}", response.text)
                         content = []
                     except requests.exceptions.RequestException as e:
-                        logger.error(f"Request error: {e}")
+                        logger.error("Request error: {}", e)
                         continue
 
                     if not content:
@@ -719,6 +834,24 @@ class Scraper:
         self.set_attr("done", True)
 
 
+@dataclass(frozen=True)
+class EnrollmentState:
+    """Enrollment progress as last published by Udemy, safe to read from other threads
+
+    Never modified: publish_progress swaps in a new instance, so a reader holding one
+    always sees a consistent set of values without taking a lock.
+    """
+
+    successfully_enrolled_c: int = 0
+    already_enrolled_c: int = 0
+    expired_c: int = 0
+    excluded_c: int = 0
+    amount_saved_c: Decimal = Decimal(0)
+    pending_c: int = 0
+    total_courses_processed: int = 0
+    course: Course = None
+
+
 class Udemy:
     def __init__(self, interface: str, debug: bool = False):
         self.interface = interface
@@ -749,9 +882,10 @@ class Udemy:
         self.amount_saved_c = Decimal(0)
 
         self.course: Course = None
+        self.state = EnrollmentState()
 
         # Log program start
-        logger.info(f"Program started - {self.interface} mode")
+        logger.info("Program started - {} mode", self.interface)
 
     def print(self, content: str, color: str = "red", **kargs):
         content = str(content)
@@ -770,26 +904,24 @@ class Udemy:
             )
 
     def get_date_from_utc(self, d: str):
-        utc_dt = datetime.strptime(d, "%Y-%m-%dT%H:%M:%SZ")
+        utc_dt = datetime.fromisoformat(d.rstrip("Z"))
         dt = utc_dt.replace(tzinfo=timezone.utc).astimezone(tz=None)
         return dt.strftime("%B %d, %Y")
 
     def get_now_to_utc(self):
-        return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        return datetime.utcnow().isoformat(timespec="seconds") + "Z"
 
     def load_settings(self):
+        first_run = False
         try:
-            with open(f"duce-{self.interface}-settings.json") as f:
-                self.settings = json.load(f)
+            self.settings = read_settings_file(f"duce-{self.interface}-settings.json")
         except FileNotFoundError:
-            with open(
+            first_run = True
+            self.settings = read_settings_file(
                 resource_path(f"default-duce-{self.interface}-settings.json")
-            ) as f:
-                self.settings = json.load(f)
-        if (
-            self.interface == "cli" and "use_browser_cookies" not in self.settings
-        ):  # v2.1
-            self.settings.get("use_browser_cookies", False)
+            )
+        if self.interface == "cli":  # v2.1
+            self.settings.setdefault("use_browser_cookies", False)
         # v2.2
         if "course_update_threshold_months" not in self.settings:
             self.settings["course_update_threshold_months"] = 24  # 2 years
@@ -799,21 +931,31 @@ class Udemy:
         if "Vietnamese" not in self.settings["languages"]:
             self.settings["languages"]["Vietnamese"] = True
 
-        if "Courson" not in self.settings["sites"]:
-            self.settings["sites"]["Courson"] = True
-        if "Course Joiner" not in self.settings["sites"]:
-            self.settings["sites"]["Course Joiner"] = True
+        # Sites added since the settings file was written, enabled in scraper_dict order
+        sites = self.settings.setdefault("sites", {})
+        missing = _ALL_SITE_KEYS - sites.keys()
+        if missing:
+            sites.update({site: True for site in scraper_dict if site in missing})
 
         self.settings["languages"] = dict(
             sorted(self.settings["languages"].items(), key=lambda item: item[0])
         )
-        self.save_settings()
+        # The cache still holds the file as parsed, so this tells if a migration changed it
+        if first_run or self.settings != _settings_cache["value"]:
+            self.save_settings()
         self.title_exclude = "\n".join(self.settings["title_exclude"])
         self.instructor_exclude = "\n".join(self.settings["instructor_exclude"])
 
     def save_settings(self):
-        with open(f"duce-{self.interface}-settings.json", "w") as f:
-            json.dump(self.settings, f, indent=4)
+        settings_file = f"duce-{self.interface}-settings.json"
+        # Written next to the real file and swapped in, so a crash mid-write can't truncate it
+        tmp_file = settings_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(self.settings, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, settings_file)
+        # Write-through, so the next load_settings doesn't re-parse what was just written
+        _settings_cache["value"] = copy.deepcopy(self.settings)
+        _settings_cache["key"] = (settings_file, os.stat(settings_file).st_mtime_ns)
 
     def compare_versions(self, version1, version2):
         v1_parts = list(map(int, version1.split(".")))
@@ -830,13 +972,7 @@ class Udemy:
         return 0
 
     def check_for_update(self) -> tuple[str, str]:
-        r_version = (
-            requests.get(
-                "https://api.github.com/repos/techtanic/Discounted-Udemy-Course-Enroller/releases/latest"
-            )
-            .json()["tag_name"]
-            .removeprefix("v")
-        )
+        r_version = get_latest_release_tag().removeprefix("v")
         c_version = VERSION.removeprefix("v")
 
         comparison = self.compare_versions(c_version, r_version)
@@ -983,7 +1119,7 @@ class Udemy:
             logger.info("Session info retrieved using existing/loaded cookies.")
             return # Successful login
         except LoginException as e:
-            logger.info(f"get_session_info failed: {e}. Proceeding to other login methods if credentials provided.")
+            logger.info("get_session_info failed: {}. Proceeding to other login methods if credentials provided.", e)
             if email and password:
                 logger.info("Falling back to manual login")
                 self.manual_login(email, password)
@@ -1010,7 +1146,7 @@ class Udemy:
             raise LoginException("No cookies available for session validation.")
 
         logger.info("Validating session with current client cookies.")
-        s = cloudscraper.CloudScraper()
+        s = get_session_scraper()
         # headers = {
         #     "authorization": "Bearer " + self.cookie_dict["access_token"],
         #     "accept": "application/json, text/plain, */*",
@@ -1047,7 +1183,7 @@ class Udemy:
         try:
             response_json = r.json()
         except requests.exceptions.JSONDecodeError:
-            logger.error(f"Failed to decode JSON from session info response: {r.text}")
+            logger.error("Failed to decode JSON from session info response: {}", r.text)
             raise LoginException("Failed to get valid session information (JSON decode error).")
         if not response_json.get("header", {}).get("isLoggedIn"):
             logger.error("Session validation failed: User not logged in or invalid cookies. Response: " + str(response_json))
@@ -1096,26 +1232,17 @@ class Udemy:
                 courses[slug] = course["enrollment_time"]
             next_page = r["next"]
         self.enrolled_courses = courses
-        logger.info(f"Enrolled courses: {len(courses)}")
+        logger.info("Enrolled courses: {}", len(courses))
 
     # Course filtering and exclusion logic
     def is_keyword_excluded(self) -> bool:
         """Check if the course title contains any excluded keywords"""
-        title = self.course.title
-        title_words = title.casefold().split()
-        for word in title_words:
-            word = word.casefold()
-            if word in self.title_exclude:
-                return True
-        return False
+        title_words = self.course.title.casefold().split()
+        return not self.title_exclude.isdisjoint(title_words)
 
     def is_instructor_excluded(self) -> bool:
         """Check if the course instructor is in the excluded list"""
-        instructors = self.course.instructors
-        for instructor in instructors:
-            if instructor in self.settings["instructor_exclude"]:
-                return True
-        return False
+        return not self.instructor_exclude.isdisjoint(self.course.instructors)
 
     def is_course_updated(self) -> bool:
         """Check if the course is updated within the threshold months"""
@@ -1123,7 +1250,7 @@ class Udemy:
         if not last_update:
             return True
         current_date = datetime.now()
-        last_update_date = datetime.strptime(last_update, "%Y-%m-%d")
+        last_update_date = datetime.fromisoformat(last_update)
         # Calculate the difference in years and months
         years = current_date.year - last_update_date.year
         months = current_date.month - last_update_date.month
@@ -1144,17 +1271,17 @@ class Udemy:
     def is_course_excluded(self):
 
         if not self.is_course_updated():
-            logger.info(f"Course excluded: Last updated {self.course.last_update}")
+            logger.info("Course excluded: Last updated {}", self.course.last_update)
         elif self.is_instructor_excluded():
-            logger.info(f"Instructor excluded: {self.course.instructors[0]}")
+            logger.info("Instructor excluded: {}", self.course.instructors[0])
         elif self.is_keyword_excluded():
             logger.info("Keyword Excluded")
         elif self.course.category not in self.categories:
-            logger.info(f"Category excluded: {self.course.category}")
+            logger.info("Category excluded: {}", self.course.category)
         elif self.course.language not in self.languages:
-            logger.info(f"Language excluded: {self.course.language}")
+            logger.info("Language excluded: {}", self.course.language)
         elif self.course.rating < self.min_rating:
-            logger.info(f"Low rating: {self.course.rating}")
+            logger.info("Low rating: {}", self.course.rating)
         else:
             return
         self.course.is_excluded = True
@@ -1164,35 +1291,49 @@ class Udemy:
         for key in scraper_dict:
             if self.settings["sites"].get(key):
                 self.sites.append(key)
-        self.categories = [
+        # Sets, so the per-course exclusion checks are hash lookups instead of list scans
+        self.categories = frozenset(
             key for key, value in self.settings["categories"].items() if value
-        ]
-        self.languages = [
+        )
+        self.languages = frozenset(
             key for key, value in self.settings["languages"].items() if value
-        ]
-        self.instructor_exclude = self.settings["instructor_exclude"]
-        self.title_exclude = self.settings["title_exclude"]
+        )
+        self.instructor_exclude = frozenset(self.settings["instructor_exclude"])
+        self.title_exclude = frozenset(self.settings["title_exclude"])
         self.min_rating = self.settings["min_rating"]
         return not all([bool(self.sites), bool(self.categories), bool(self.languages)])
 
     # Course data retrieval
-    def get_course_id(self):
-        """Set course_id and metadata and is_excluded"""
-        if self.course.course_id:
-            return
-        url = re.sub(r"\W+$", "", unquote(self.course.url))
-        r = None
+    def fetch_course_page(
+        self, course: Course, client: requests.Session = None
+    ) -> requests.Response:
+        """Get the landing page of a course, trying up to 3 times. None if all attempts fail
+
+        Args:
+            client: Session to use from threads other than the enrollment one, defaults to self.client
+        """
+        client = client or self.client
+        url = re.sub(r"\W+$", "", unquote(course.url))
         for _ in range(3):
             try:
-                r = self.client.get(url)
+                return client.get(url)
             except requests.exceptions.ConnectionError:
-                r = None
                 continue
             except Exception as e:
-                logger.error(f"Error fetching course ID: {e}")
-                logger.error(f"Course URL: {url}")
-                r = None
+                logger.error("Error fetching course ID: {}", e)
+                logger.error("Course URL: {}", url)
                 continue
+        return None
+
+    def get_course_id(self, page: concurrent.futures.Future = None):
+        """Set course_id and metadata and is_excluded
+
+        Args:
+            page: Pending landing page request for the course, fetched here if not given
+        """
+        if self.course.course_id:
+            return
+        r = page.result() if page else self.fetch_course_page(self.course)
 
         if r is None:
             logger.error("Failed to fetch course ID after 3 attempts")
@@ -1209,7 +1350,7 @@ class Udemy:
             return
 
         self.course.course_id = course_id
-        dma = json.loads(soup.find("body")["data-module-args"])
+        dma = orjson.loads(soup.find("body")["data-module-args"])
         if self.debug:
             os.makedirs("debug/", exist_ok=True)
             with open("debug/dma.json", "w") as f:
@@ -1225,19 +1366,19 @@ class Udemy:
         url = f"https://www.udemy.com/api-2.0/course-landing-components/{self.course.course_id}/me/?components=purchase"
         if self.course.coupon_code:
             url += f",redeem_coupon&couponCode={self.course.coupon_code}"
-        logger.debug(f"Checking course: {url}")
+        logger.debug("Checking course: {}", url)
         for _ in range(3):
             try:
                 r = self.client.get(url)
-                r = r.json()
+                r = orjson.loads(r.content)
                 break
             except requests.exceptions.ConnectionError:
                 r = None
             except Exception as e:
-                logger.error(f"Error fetching course data: {e}")
-                logger.error(f"Course ID: {self.course.course_id}")
-                logger.error(f"Coupon Code: {self.course.coupon_code}")
-                logger.error(f"URL: {url}")
+                logger.error("Error fetching course data: {}", e)
+                logger.error("Course ID: {}", self.course.course_id)
+                logger.error("Coupon Code: {}", self.course.coupon_code)
+                logger.error("URL: {}", url)
                 r = None
         amount = (
             r.get("purchase", {})
@@ -1247,7 +1388,7 @@ class Udemy:
         )
         self.course.price = Decimal(str(amount)) if amount is not None else None
         if self.course.price is None:
-            logger.error(f"Course not found {self.course.course_id}")
+            logger.error("Course not found {}", self.course.course_id)
             logger.error("Report to developer")
             raise Exception("Course not found")
 
@@ -1263,7 +1404,7 @@ class Udemy:
                 self.txt_file.flush()
                 os.fsync(self.txt_file.fileno())
             except Exception as e:
-                logger.exception(f"Error writing course to file: {e}")
+                logger.exception("Error writing course to file: {}", e)
 
     def is_already_enrolled(self):
         """Check if the course is already enrolled."""
@@ -1286,77 +1427,133 @@ class Udemy:
         self.valid_courses: list[Course] = []
         self.total_courses_processed = 0  # Track progress for UI display
 
-        for index, current_course in enumerate(courses):
-            self.course = current_course
-            self.total_courses_processed = (
-                index + 1
-            )  # Update processing counter for UI thread
+        # Landing pages of the next few courses are requested in the background while
+        # the current one is processed, so their round trips overlap
+        prefetch = 5
+        pages: dict[int, concurrent.futures.Future] = {}
+        # requests sessions aren't thread-safe and self.client keeps being used here for
+        # checkouts, so each pool thread gets its own session seeded from a snapshot
+        headers = dict(self.client.headers)
+        cookies = self.client.cookies.copy()
+        prefetch_sessions = threading.local()
+
+        def start_prefetch_session():
+            prefetch_sessions.client = requests.session()
+            prefetch_sessions.client.headers.update(headers)
+            prefetch_sessions.client.cookies.update(cookies)
+
+        def prefetch_page(course: Course) -> requests.Response:
+            return self.fetch_course_page(course, prefetch_sessions.client)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=prefetch,
+            thread_name_prefix="prefetch",
+            initializer=start_prefetch_session,
+        ) as executor:
+            for index, current_course in enumerate(courses):
+                for ahead in range(index, min(index + prefetch, self.total_courses)):
+                    course = courses[ahead]
+                    if (
+                        ahead not in pages
+                        and not course.course_id
+                        and course.slug not in self.enrolled_courses
+                    ):
+                        pages[ahead] = executor.submit(prefetch_page, course)
+                page = pages.pop(index, None)
+                self.course = current_course
+                self.total_courses_processed = (
+                    index + 1
+                )  # Update processing counter for UI thread
 
-            logger.info(
-                f"Processing course {index + 1} / {self.total_courses}: {str(self.course)}"
-            )
-            if self.is_already_enrolled():
                 logger.info(
-                    f"Already enrolled on {self.get_date_from_utc(self.enrolled_courses[self.course.slug])}"
+                    "Processing course {} / {}: {}",
+                    index + 1,
+                    self.total_courses,
+                    self.course,
                 )
-                self.already_enrolled_c += 1
-            else:
-                self.get_course_id()
-                if not self.course.is_valid:
-                    logger.error(f"Invalid: {self.course.error}")
-                    self.excluded_c += 1
-
-                elif self.is_already_enrolled():
+                if self.is_already_enrolled():
                     logger.info(
-                        f"Already enrolled on {self.get_date_from_utc(self.enrolled_courses[self.course.slug])}"
+                        "Already enrolled on {}",
+                        self.get_date_from_utc(self.enrolled_courses[self.course.slug]),
                     )
                     self.already_enrolled_c += 1
-                elif self.course.is_excluded:
-                    self.excluded_c += 1
-
-                elif self.course.is_free:
+                else:
+                    self.get_course_id(page)
+                    if not self.course.is_valid:
+                        logger.error("Invalid: {}", self.course.error)
+                        self.excluded_c += 1
 
-                    if self.settings["discounted_only"]:
+                    elif self.is_already_enrolled():
                         logger.info(
-                            "Free course excluded (discounted only setting)",
-                            color="light blue",
+                            "Already enrolled on {}",
+                            self.get_date_from_utc(self.enrolled_courses[self.course.slug]),
                         )
+                        self.already_enrolled_c += 1
+                    elif self.course.is_excluded:
                         self.excluded_c += 1
-                    else:
-                        self.free_checkout()
-                        if self.course.status:
-                            logger.success("Successfully Subscribed")
-                            self.successfully_enrolled_c += 1
-                            self.save_course()
-                        else:
+
+                    elif self.course.is_free:
+
+                        if self.settings["discounted_only"]:
                             logger.info(
-                                "Unknown Error: Report this link to the developer",
+                                "Free course excluded (discounted only setting)",
+                                color="light blue",
                             )
+                            self.excluded_c += 1
+                        else:
+                            self.free_checkout()
+                            if self.course.status:
+                                logger.success("Successfully Subscribed")
+                                self.successfully_enrolled_c += 1
+                                self.save_course()
+                            else:
+                                logger.info(
+                                    "Unknown Error: Report this link to the developer",
+                                )
+                                self.expired_c += 1
+
+                    elif not self.course.is_free:
+                        self.check_course()
+                        if not self.course.is_coupon_valid:
+                            logger.info("Coupon Expired")
                             self.expired_c += 1
 
-                elif not self.course.is_free:
-                    self.check_course()
-                    if not self.course.is_coupon_valid:
-                        logger.info("Coupon Expired")
-                        self.expired_c += 1
-
-                if self.course.is_coupon_valid:
-                    self.valid_courses.append(self.course)
-                    logger.info("Added for enrollment")
+                    if self.course.is_coupon_valid:
+                        self.valid_courses.append(self.course)
+                        logger.info("Added for enrollment")
 
-                self.update_progress()
-                if len(self.valid_courses) >= 5:
-                    self.bulk_checkout()
-                    self.valid_courses.clear()
-            self.update_progress()
+                    self.publish_progress()
+                    if len(self.valid_courses) >= 5:
+                        self.bulk_checkout()
+                        self.valid_courses.clear()
+                self.publish_progress()
 
         if self.valid_courses:
             self.bulk_checkout()
             self.valid_courses.clear()
+            self.publish_progress()
         logger.info("Enrollment process completed")
         logger.info(
-            f"Successfully Enrolled: {self.successfully_enrolled_c}\nAlready Enrolled: {self.already_enrolled_c}\nExpired: {self.expired_c}\nExcluded: {self.excluded_c}"
+            "Successfully Enrolled: {}\nAlready Enrolled: {}\nExpired: {}\nExcluded: {}",
+            self.successfully_enrolled_c,
+            self.already_enrolled_c,
+            self.expired_c,
+            self.excluded_c,
+        )
+
+    def publish_progress(self):
+        """Publish the counters as a new self.state and notify the UI"""
+        self.state = EnrollmentState(
+            successfully_enrolled_c=self.successfully_enrolled_c,
+            already_enrolled_c=self.already_enrolled_c,
+            expired_c=self.expired_c,
+            excluded_c=self.excluded_c,
+            amount_saved_c=self.amount_saved_c,
+            pending_c=len(self.valid_courses),
+            total_courses_processed=self.total_courses_processed,
+            course=self.course,
         )
+        self.update_progress()
 
     def setup_txt_file(self):
         if self.settings["save_txt"]:
@@ -1433,7 +1630,10 @@ class Udemy:
                     r = r.json()
             except Exception as e:
                 logger.exception(
-                    f"Unknown Error during bulk checkout: {e}\nResponse: {r.text} {payload}"
+                    "Unknown Error during bulk checkout: {}\nResponse: {} {}",
+                    e,
+                    r.text,
+                    payload,
                 )
                 return
             if r.get("status") == "succeeded":
@@ -1448,11 +1648,11 @@ class Udemy:
                     self.successfully_enrolled_c += 1
                     self.save_course()
                 logger.success(
-                    f"Successfully Enrolled To {len(self.valid_courses)} Courses :)",
+                    "Successfully Enrolled To {} Courses :)", len(self.valid_courses),
                     color="green",
                 )
                 return
-            logger.error(f"Bulk checkout failed {_+1}: {r}, Retrying...")
+            logger.error("Bulk checkout failed {}: {}, Retrying...", _+1, r)
             self.client.get("https://www.udemy.com/payment/checkout/", headers=headers)
             time.sleep(5 + _)
 
@@ -1,5 +1,3 @@
-import threading
-import time
 import traceback
 import sys
 from datetime import datetime
@@ -18,14 +16,22 @@ from rich.progress import (
 from rich.table import Table
 from rich.text import Text
 from rich import box
-from base import VERSION, LoginException, Scraper, Udemy, scraper_dict, logger
+from base import (
+    VERSION,
+    EnrollmentState,
+    LoginException,
+    Scraper,
+    Udemy,
+    scraper_dict,
+    logger,
+)
 
 
 console = Console()
 
 
 def handle_error(error_message, error=None, exit_program=True):
-    logger.error(f"ERROR: {error_message}")
+    logger.error("ERROR: {}", error_message)
     """
     Handle errors consistently throughout the application.
 
@@ -40,12 +46,13 @@ def handle_error(error_message, error=None, exit_program=True):
 
     if error:
         error_details = str(error)
-        trace = traceback.format_exc()
+        # Scraper errors arrive as an already formatted traceback, outside any except block
+        trace = traceback.format_exc() if sys.exc_info()[1] else error_details
         console.print(f"[red]Details: {error_details}[/red]")
         console.print("[yellow]Full traceback:[/yellow]")
         console.print(Panel(trace, border_style="red"))
 
-        logger.exception(f"{error_message} - Details: {error_details}")
+        logger.error("{} - Details: {}\n{}", error_message, error_details, trace)
 
     if exit_program:
         sys.exit(1)
@@ -69,27 +76,70 @@ def create_layout() -> Layout:
     return layout
 
 
-def create_header() -> Panel:
+class Header:
+    """Header panel whose clock is read when Rich draws it, not when the layout is built."""
+
+    def __init__(self):
+        self.prefix = f"[bold blue]Discounted Udemy Course Enroller[/bold blue] [cyan]{VERSION}[/cyan] | Logged in as: [bold green]{udemy.display_name}[/bold green] | "
+        self.shown_at = None
+        self.panel = None
+
+    def __rich__(self) -> Panel:
+        # Live redraws several times a second, but the clock only changes once a second
+        now = datetime.now().replace(microsecond=0)
+        if now != self.shown_at:
+            self.shown_at = now
+            self.panel = Panel(
+                f"{self.prefix}[yellow]{now.isoformat(sep=' ')}[/yellow]",
+                style="white on blue",
+            )
+        return self.panel
+
+
+def create_header() -> Header:
     """Create the header panel."""
-    return Panel(
-        f"[bold blue]Discounted Udemy Course Enroller[/bold blue] [cyan]{VERSION}[/cyan] | Logged in as: [bold green]{udemy.display_name}[/bold green] | [yellow]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/yellow]",
-        style="white on blue",
-    )
+    return Header()
+
+
+class ProgressPanel:
+    """Panel drawn from udemy.state, rebuilt only when the values it shows have changed.
+
+    Rich pulls it on every Live refresh, so the redraw rate is capped by the Live's
+    refresh_per_second and the latest state is always what ends up on screen.
+    """
+
+    def __init__(self, build, key):
+        self.build = build  # EnrollmentState -> Panel
+        self.key = key  # EnrollmentState -> values the panel displays
+        self.shown = None
+        self.panel = None
+
+    def __rich__(self) -> Panel:
+        stats = udemy.state
+        key = self.key(stats)
+        if self.panel is None or key != self.shown:
+            self.shown = key
+            self.panel = self.build(stats)
+        return self.panel
+
+
+_FOOTER = Panel(
+    "Made with [bold magenta]:heart:[/bold magenta]  by techtanic",
+    style="white on dark_blue",
+    border_style="bright_blue",
+    padding=(0, 2),
+)
 
 
 def create_footer() -> Panel:
     """Create the footer panel."""
 
-    return Panel(
-        "Made with [bold magenta]:heart:[/bold magenta]  by techtanic",
-        style="white on dark_blue",
-        border_style="bright_blue",
-        padding=(0, 2),
-    )
+    return _FOOTER
 
 
-def create_stats_panel(udemy: Udemy) -> Panel:
+def create_stats_panel(udemy: Udemy, stats: EnrollmentState = None) -> Panel:
     """Create the statistics panel similar to the GUI version."""
+    stats = stats or udemy.state
 
     row1 = Table.grid(padding=3)
     row1.add_column(style="cyan", justify="right", width=22)
@@ -101,11 +151,11 @@ def create_stats_panel(udemy: Udemy) -> Panel:
 
     row1.add_row(
         "Successfully Enrolled:",
-        f"[green]{udemy.successfully_enrolled_c}[/green]",
+        f"[green]{stats.successfully_enrolled_c}[/green]",
         "Already Enrolled:",
-        f"[cyan]{udemy.already_enrolled_c}[/cyan]",
+        f"[cyan]{stats.already_enrolled_c}[/cyan]",
         "Expired Courses:",
-        f"[red]{udemy.expired_c}[/red]",
+        f"[red]{stats.expired_c}[/red]",
     )
 
     row2 = Table.grid(padding=3)
@@ -118,11 +168,11 @@ def create_stats_panel(udemy: Udemy) -> Panel:
 
     row2.add_row(
         "Amount Saved:",
-        f"[green]{round(udemy.amount_saved_c, 2)} {udemy.currency.upper()}[/green]",
+        f"[green]{round(stats.amount_saved_c, 2)} {udemy.currency.upper()}[/green]",
         "Excluded Courses:",
-        f"[yellow]{udemy.excluded_c}[/yellow]",
+        f"[yellow]{stats.excluded_c}[/yellow]",
         "Pending Enrollment:",
-        f"[orange1]{len(getattr(udemy, 'valid_courses', []))}/5[/orange1]",
+        f"[orange1]{stats.pending_c}/5[/orange1]",
     )
 
     grid = Table.grid(padding=2)
@@ -137,12 +187,15 @@ def create_stats_panel(udemy: Udemy) -> Panel:
     )
 
 
-def create_course_panel(udemy: Udemy, total_courses: int) -> Panel:
+def create_course_panel(
+    udemy: Udemy, total_courses: int, stats: EnrollmentState = None
+) -> Panel:
     """Create the current course information panel."""
-    if hasattr(udemy, "course") and udemy.course:
-        title = udemy.course.title
-        url = udemy.course.url
-        progress = f"Course {udemy.total_courses_processed} / {total_courses}"
+    stats = stats or udemy.state
+    if stats.course:
+        title = stats.course.title
+        url = stats.course.url
+        progress = f"Course {stats.total_courses_processed} / {total_courses}"
     else:
         title = "No course currently processing"
         url = "N/A"
@@ -164,61 +217,35 @@ def create_course_panel(udemy: Udemy, total_courses: int) -> Panel:
     )
 
 
-def create_scraping_thread(site: str):
-
-    code_name = scraper_dict[site]
-    task_id = udemy.progress.add_task(site, total=100)
-    try:
-        threading.Thread(target=getattr(scraper, code_name), daemon=True).start()
-        # Wait for the scraper to initialize and set its length
-        while getattr(scraper, f"{code_name}_length") == 0:
-            time.sleep(0.1)
-        
-        if getattr(scraper, f"{code_name}_length") == -1:
-            # Error occurred during scraper's initialization (e.g., initial fetch failed)
-            # Scraper's handle_exception should have set an error message.
-            error_msg = getattr(scraper, f"{code_name}_error", f"Initialization error in {site}")
-            udemy.progress.update(task_id, description=f"[red]Error: {site}[/red]", completed=100, total=100)
-            raise Exception(error_msg) # Will be caught by the except block below
-
-        scraper_total_length = getattr(scraper, f"{code_name}_length")
-        udemy.progress.update(task_id, total=scraper_total_length)
-
-        while not getattr(scraper, f"{code_name}_done") and not getattr(
-            scraper, f"{code_name}_error"
-        ):
-            current = getattr(scraper, f"{code_name}_progress")
-            udemy.progress.update(
-                task_id,
-                completed=current,
-                total=scraper_total_length,
-            )
-            time.sleep(0.1)
-
-        if getattr(scraper, f"{code_name}_error"):
-            # Error occurred during scraping process
-            error_msg = getattr(scraper, f"{code_name}_error", f"Runtime error in {site}")
-            udemy.progress.update(task_id, description=f"[red]Error: {site}[/red]", completed=scraper_total_length, total=scraper_total_length)
-            raise Exception(error_msg) # Will be caught by the except block below
+def update_scraping_progress(site: str, attr: str, value):
+    """Reflect a scraper update (length, progress or done) in the site's progress bar"""
+    task_id = scraping_tasks[site]
+    if attr == "length":
+        if value > 0:
+            udemy.progress.update(task_id, total=value)
+    elif attr == "progress":
+        udemy.progress.update(task_id, completed=value)
+    elif attr == "done":
+        code_name = scraper_dict[site]
+        state = scraper.site_states[code_name]
+        error = state.error
+        total = state.length
+        # Use a default total if the scraper's length wasn't set or was -1
+        if total <= 0:
+            total = 100
+        if error:
+            # Ensure the task in progress bar is marked as "finished" but indicates error
+            udemy.progress.update(task_id, description=f"[red]Failed: {site}[/red]", completed=total, total=total)
+            handle_error(f"Error scraping {site}. Continuing with other sites.", error=error, exit_program=False)
         else:
             # Successfully completed
-            udemy.progress.update(task_id, completed=scraper_total_length)
-            logger.debug(
-                f"Courses Found {code_name}: {len(getattr(scraper, f'{code_name}_data'))}"
-            )
+            udemy.progress.update(task_id, completed=total, total=total)
+            logger.debug("Courses Found {}: {}", code_name, len(state.data))
 
-    except Exception:
-        error = getattr(scraper, f"{code_name}_error", traceback.format_exc())
-        # Ensure the task in progress bar is marked as "finished" but indicates error
-        # Use a default total if scraper_total_length wasn't set or was -1
-        current_total_for_progress = getattr(scraper, f"{code_name}_length", 100)
-        if current_total_for_progress <= 0: current_total_for_progress = 100
-        udemy.progress.update(task_id, description=f"[red]Failed: {site}[/red]", completed=current_total_for_progress, total=current_total_for_progress)
-        handle_error(f"Error scraping {site}. Continuing with other sites.", error=error, exit_program=False)
-        setattr(scraper, f"{code_name}_done", True) # Ensure scraper is marked as done
 
-
-if __name__ == "__main__":
+def run_enrollment():
+    """Log in, scrape the selected sites and enroll in what they found"""
+    global udemy, scraper, scraping_tasks
     try:
         logger.info("Starting CLI application")
         udemy = Udemy("cli")
@@ -250,7 +277,7 @@ if __name__ == "__main__":
                 continue # Exit while loop
 
             except LoginException as e_pkl: # cookies.pkl failed (not found or invalid)
-                logger.info(f"Login with {login_method_attempted} failed: {e_pkl}")
+                logger.info("Login with {} failed: {}", login_method_attempted, e_pkl)
                 console.print(f"[yellow]Login with {login_method_attempted} failed. Trying next method...[/yellow]")
 
                 # Attempt 2: Browser Cookies
@@ -264,7 +291,7 @@ if __name__ == "__main__":
                         login_successful = True
                         continue # Exit while loop
                     except LoginException as e_browser:
-                        logger.info(f"Login with {login_method_attempted} failed: {e_browser}")
+                        logger.info("Login with {} failed: {}", login_method_attempted, e_browser)
                         console.print(f"[red]Login with {login_method_attempted} failed. Disabling this option for this session.[/red]")
                         udemy.settings["use_browser_cookies"] = False # Avoid retrying this path
                         # Fall through to saved credentials or manual input
@@ -279,7 +306,7 @@ if __name__ == "__main__":
                         login_successful = True
                         continue # Exit while loop
                     except LoginException as e_saved:
-                        logger.info(f"Login with {login_method_attempted} failed: {e_saved}")
+                        logger.info("Login with {} failed: {}", login_method_attempted, e_saved)
                         console.print(f"[red]Login with {login_method_attempted} failed. Clearing saved credentials.[/red]")
                         udemy.settings["email"], udemy.settings["password"] = "", ""
                         # Fall through to manual input
@@ -297,7 +324,7 @@ if __name__ == "__main__":
                     login_successful = True
                     continue # Exit while loop
                 except LoginException as e_manual:
-                    logger.info(f"Login with {login_method_attempted} failed: {e_manual}")
+                    logger.info("Login with {} failed: {}", login_method_attempted, e_manual)
                     console.print(f"[red]Login with {login_method_attempted} failed: {e_manual}[/red]")
                     if console.input("[yellow]Try manual login again? (y/n): [/yellow]").lower() != 'y':
                         handle_error("Login failed. Exiting.", exit_program=True)
@@ -313,7 +340,7 @@ if __name__ == "__main__":
         udemy.save_settings()
         # Header will be updated with display_name later in the Live context
         console.print(f"[bold green]Login successful. Welcome {udemy.display_name}![/bold green]")
-        logger.info(f"Logged in as {udemy.display_name}")
+        logger.info("Logged in as {}", udemy.display_name)
 
         user_dumb = udemy.is_user_dumb()
         if user_dumb:
@@ -339,33 +366,52 @@ if __name__ == "__main__":
             TimeRemainingColumn(elapsed_when_finished=True),
         )
         with udemy.progress:
-            udemy.scraped_data = scraper.get_scraped_courses(create_scraping_thread)
+            scraping_tasks = {
+                site: udemy.progress.add_task(site, total=100) for site in udemy.sites
+            }
+            udemy.scraped_data = scraper.get_scraped_courses(update_scraping_progress)
         total_courses = len(udemy.scraped_data)
         console.print(f"[green]Found {total_courses} courses to process[/green]")
 
         layout = create_layout()
         layout["header"].update(create_header()) # Header now includes display_name
         layout["footer"].update(create_footer())
-        layout["main"]["course_info"].update(create_course_panel(udemy, total_courses))
-        layout["main"]["stats"].update(create_stats_panel(udemy))
+        layout["main"]["course_info"].update(
+            ProgressPanel(
+                lambda stats: create_course_panel(udemy, total_courses, stats),
+                lambda stats: (
+                    stats.course and (stats.course.title, stats.course.url),
+                    stats.total_courses_processed,
+                ),
+            )
+        )
+        layout["main"]["stats"].update(
+            ProgressPanel(
+                lambda stats: create_stats_panel(udemy, stats),
+                lambda stats: (
+                    stats.successfully_enrolled_c,
+                    stats.already_enrolled_c,
+                    stats.expired_c,
+                    stats.amount_saved_c,
+                    stats.excluded_c,
+                    stats.pending_c,
+                ),
+            )
+        )
 
         udemy.total_courses_processed = 0
         udemy.total_courses = total_courses
 
-        with Live(layout, screen=False, transient=True) as live:
-
-            def update_progress():
-                layout["main"]["course_info"].update(
-                    create_course_panel(udemy, total_courses)
-                )
-                layout["main"]["stats"].update(create_stats_panel(udemy))
-                live.update(layout)
-
-            udemy.update_progress = update_progress
+        # The panels read udemy.state when Live draws them, at most 10 times a second,
+        # so the enrollment thread has nothing to render when it reports progress
+        with Live(layout, screen=False, transient=True, refresh_per_second=10):
+            udemy.update_progress = lambda: None
 
+            interrupted = False
             try:
                 udemy.start_new_enroll()
             except KeyboardInterrupt:
+                interrupted = True
                 console.print("[bold yellow]Process interrupted by user[/bold yellow]")
             except Exception as e:
                 handle_error(
@@ -392,8 +438,16 @@ if __name__ == "__main__":
 
         console.print(table)
 
+        if interrupted:
+            # Let the caller stop too, e.g. app.py's scheduler running this in-process
+            raise KeyboardInterrupt
+
     except Exception as e:
         handle_error("A critical error occurred", error=e, exit_program=True)
+    finally:
+        # app.py runs this every few hours in-process; don't keep the last run's
+        # scraped data and enrolled courses alive until the next one
+        udemy = scraper = scraping_tasks = None
     #                     udemy.fetch_cookies()
     #                     login_method = "Browser Cookies"
     #             elif udemy.settings["email"] and udemy.settings["password"]:
@@ -523,3 +577,10 @@ if __name__ == "__main__":
 
     # except Exception as e:
     #     handle_error("A critical error occurred", error=e, exit_program=True)
+
+
+if __name__ == "__main__":
+    try:
+        run_enrollment()
+    except KeyboardInterrupt:
+        pass  # Already reported, along with the results so far
@@ -1,7 +1,7 @@
 import os
+import re
 import sys
 import threading
-import time
 import traceback
 from webbrowser import open as web
 
@@ -30,54 +30,46 @@ sg.set_options(
     font=10,
 )
 
+# Scalar settings read from the main window, with the type they are stored as
+SETTINGS_SCHEMA = (
+    ("min_rating", float),
+    ("course_update_threshold_months", int),
+    ("save_txt", bool),
+    ("discounted_only", bool),
+)
+# Splits a textarea into lines, trimming the blanks around each newline
+LINE_SPLIT_RE = re.compile(r"[^\S\n]*\n[^\S\n]*")
 
-def update_enrolled_courses():
-    while True:
-        logger.debug(f"Enrolled courses count: {len(udemy.enrolled_courses)}")
-        new_menu = [
-            ["Help", ["Support", "Github", "Discord"]],
-            [f"Total Courses: {len(udemy.enrolled_courses)}"],
-        ]
-        main_window.write_event_value("Update-Menu", new_menu)
-        time.sleep(10)
-
-
-def create_scraping_thread(site: str):
-    logger.info(f"Launching scraping thread for site: {site}")
-    code_name = scraper_dict[site]
-    main_window[f"i{site}"].update(visible=False)
-    main_window[f"p{site}"].update(0, visible=True)
 
-    try:
-        threading.Thread(target=getattr(scraper, code_name), daemon=True).start()
-        while getattr(scraper, f"{code_name}_length") == 0:
-            time.sleep(0.1)
-        if getattr(scraper, f"{code_name}_length") == -1:
-
-            raise Exception(f"Error in: {site}")
-        main_window[f"p{site}"].update(0, max=getattr(scraper, f"{code_name}_length"))
-        while not getattr(scraper, f"{code_name}_done") and not getattr(
-            scraper, f"{code_name}_error"
-        ):
-            main_window[f"p{site}"].update(
-                getattr(scraper, f"{code_name}_progress") + 1,
-                max=getattr(scraper, f"{code_name}_length"),
+def update_enrolled_courses():
+    """Show the enrolled course count in the menu bar, called whenever it may have changed"""
+    logger.debug("Enrolled courses count: {}", len(udemy.enrolled_courses))
+    new_menu = [
+        ["Help", ["Support", "Github", "Discord"]],
+        [f"Total Courses: {len(udemy.enrolled_courses)}"],
+    ]
+    main_window.write_event_value("Update-Menu", new_menu)
+
+
+def update_scraping_progress(site: str, attr: str, value):
+    """Reflect a scraper update (length, progress or done) in the site's progress bar"""
+    progress_bar = main_window[f"p{site}"]
+    if attr == "length":
+        if value > 0:
+            progress_bar.update(0, max=value)
+    elif attr == "progress":
+        progress_bar.update(value + 1)
+    elif attr == "done":
+        code_name = scraper_dict[site]
+        state = scraper.site_states[code_name]
+        logger.info("Courses Found {}: {}", code_name, len(state.data))
+        error_message = state.error
+        if error_message:
+            logger.error("Error in {}: {}", site, error_message)
+            main_window.write_event_value(
+                "Error", f"{error_message}|:|Unknown Error in: {site} {VERSION}"
             )
-
-            time.sleep(0.1)
-        logger.info(
-            f"Courses Found {code_name}: {len(getattr(scraper, f'{code_name}_data'))}"
-        )
-        if getattr(scraper, f"{code_name}_error"):
-            raise Exception(f"Error in: {site}")
-    except Exception:
-        error_message = getattr(scraper, f"{code_name}_error", "Unknown Error")
-        logger.exception(f"Error in {site}: {error_message}")
-        main_window.write_event_value(
-            "Error", f"{error_message}|:|Unknown Error in: {site} {VERSION}"
-        )
-    finally:
-        main_window[f"p{site}"].update(0, visible=False)
+        progress_bar.update(0, visible=False)
         main_window[f"i{site}"].update(visible=True)
 
 
@@ -88,9 +80,11 @@ def scrape():
     try:
         for site in udemy.sites:
             main_window[f"pcol{site}"].update(visible=True)
+            main_window[f"i{site}"].update(visible=False)
+            main_window[f"p{site}"].update(0, visible=True)
         main_window["main_col"].update(visible=False)
         main_window["scrape_col"].update(visible=True)
-        udemy.scraped_data = scraper.get_scraped_courses(create_scraping_thread)
+        udemy.scraped_data = scraper.get_scraped_courses(update_scraping_progress)
         main_window["scrape_col"].update(visible=False)
 
         main_window["enrollment_panel"].update(visible=True)
@@ -98,31 +92,41 @@ def scrape():
         main_window["current_course_panel"].update(visible=True)
 
         total_courses = len(udemy.scraped_data)
+        last_shown = None
+        enrolled_shown = len(udemy.enrolled_courses)
 
         def update_progress():
-
-            if hasattr(udemy, "course") and udemy.course:
-                main_window["current_course_title"].update(value=udemy.course.title)
-                main_window["current_course_url"].update(value=udemy.course.url)
-
-            if hasattr(udemy, "total_courses_processed"):
-                progress_text = (
-                    f"Course {udemy.total_courses_processed:4d}/{total_courses:4d}"
-                )
-                main_window["course_progress"].update(value=progress_text)
+            nonlocal last_shown, enrolled_shown
+            stats = udemy.state
+            # start_new_enroll reports twice per course; skip redrawing if nothing changed
+            if stats == last_shown:
+                return
+            last_shown = stats
+
+            if len(udemy.enrolled_courses) != enrolled_shown:
+                enrolled_shown = len(udemy.enrolled_courses)
+                update_enrolled_courses()
+
+            if stats.course:
+                main_window["current_course_title"].update(value=stats.course.title)
+                main_window["current_course_url"].update(value=stats.course.url)
+
+            progress_text = (
+                f"Course {stats.total_courses_processed:4d}/{total_courses:4d}"
+            )
+            main_window["course_progress"].update(value=progress_text)
 
             main_window["stat_enrolled"].update(
-                value=f"{udemy.successfully_enrolled_c}"
+                value=f"{stats.successfully_enrolled_c}"
             )
             main_window["stat_amount_saved"].update(
-                value=f"{round(udemy.amount_saved_c, 2)} {udemy.currency.upper()}"
+                value=f"{round(stats.amount_saved_c, 2)} {udemy.currency.upper()}"
             )
-            main_window["stat_already"].update(value=f"{udemy.already_enrolled_c}")
-            main_window["stat_excluded"].update(value=f"{udemy.excluded_c}")
-            main_window["stat_expired"].update(value=f"{udemy.expired_c}")
+            main_window["stat_already"].update(value=f"{stats.already_enrolled_c}")
+            main_window["stat_excluded"].update(value=f"{stats.excluded_c}")
+            main_window["stat_expired"].update(value=f"{stats.expired_c}")
 
-            ready_count = len(getattr(udemy, "valid_courses", []))
-            main_window["stat_ready_enroll"].update(value=f"{ready_count}/5")
+            main_window["stat_ready_enroll"].update(value=f"{stats.pending_c}/5")
 
         udemy.update_progress = update_progress
 
@@ -130,6 +134,7 @@ def scrape():
 
         # Start enrollment process
         udemy.start_new_enroll()
+        update_enrolled_courses()
 
         main_window["enrollment_panel"].update(visible=False)
         main_window["done_col"].update(visible=True)
@@ -149,9 +154,7 @@ def scrape():
     except Exception:
         e = traceback.format_exc()
 
-        logger.exception(
-            f"Error during scraping/enrollment: {e}\nCourse: {str(udemy.course)}"
-        )
+        logger.error("Error during scraping/enrollment: {}\nCourse: {}", e, udemy.course)
 
         main_window.write_event_value(
             "Error",
@@ -244,7 +247,7 @@ if login_error:
     login_window = sg.Window(login_title, login_layout, finalize=True)
     while True:
         event, values = login_window.read()
-        logger.info(f"Login window event: {event}")
+        logger.info("Login window event: {}", event)
         if event in (None,):
             login_window.close()
             sys.exit()
@@ -270,8 +273,8 @@ if login_error:
                     )
 
             except Exception:
-                logger.exception("Error in auto login")
                 e = traceback.format_exc()
+                logger.error("Error in auto login\n{}", e)
                 sg.popup_scrolled(e, title=f"Unknown Error {VERSION}")
 
             login_window["a_login"].update(disabled=False)
@@ -317,7 +320,7 @@ if login_error:
                     )
             except Exception:
                 e = traceback.format_exc()
-                logger.exception()
+                logger.error("Error in manual login\n{}", e)
                 sg.popup_scrolled(e, title=f"Unknown Error {VERSION}")
 
 checkbox_lo = []
@@ -718,13 +721,13 @@ main_window = sg.Window(
     main_lo,
     finalize=True,
 )
-threading.Thread(target=update_enrolled_courses, daemon=True).start()
+update_enrolled_courses()
 while True:
     event, values = main_window.read()
 
-    logger.info(f"Main window event: {event}")
+    logger.info("Main window event: {}", event)
     if event == "Dummy":
-        logger.debug(f"Dummy event values: {values}")
+        logger.debug("Dummy event values: {}", values)
 
     if event in (None, "Exit"):
         break
@@ -751,20 +754,17 @@ while True:
 
     elif event == "Start" and main_window["main_col"].visible:
 
-        for setting in ["languages", "categories", "sites"]:
-            for key in udemy.settings[setting]:
-                udemy.settings[setting][key] = values[key]
+        for setting in ("languages", "categories", "sites"):
+            udemy.settings[setting] = {
+                key: values[key] for key in udemy.settings[setting]
+            }
+        for key, cast in SETTINGS_SCHEMA:
+            udemy.settings[key] = cast(values[key])
 
         udemy.settings["instructor_exclude"] = str(values["instructor_exclude"]).split()
         udemy.settings["title_exclude"] = list(
-            filter(None, values["title_exclude"].split("\n"))
-        )
-        udemy.settings["min_rating"] = float(values["min_rating"])
-        udemy.settings["course_update_threshold_months"] = int(
-            values["course_update_threshold_months"]
+            filter(None, LINE_SPLIT_RE.split(values["title_exclude"].strip()))
         )
-        udemy.settings["save_txt"] = values["save_txt"]
-        udemy.settings["discounted_only"] = values["discounted_only"]
         udemy.save_settings()
 
         user_dumb = udemy.is_user_dumb()
@@ -784,7 +784,7 @@ while True:
         error_text = msg[0]
         title = msg[1]
 
-        logger.exception(f"GUI Error Popup: {title} - {error_text}")
+        logger.error("GUI Error Popup: {} - {}", title, error_text)
 
         sg.popup_scrolled(error_text, title=title)
     elif event == "Update-Menu":
@@ -1,22 +1,30 @@
 import gradio as gr
 import subprocess
 import time
+from collections import deque
+
+# Lines of output kept on screen; older ones scroll off
+MAX_LOG_LINES = 500
+
 
 def run_app():
-    process = subprocess.Popen(["python", "app.py"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    logs = ""
-    while True:
-        line = process.stdout.readline()
-        if not line:
-            break
-        log_line = line.decode("utf-8")
-        logs += log_line
-        yield logs
+    process = subprocess.Popen(
+        ["python", "app.py"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        encoding="utf-8",
+    )
+    logs = deque(maxlen=MAX_LOG_LINES)
+    for line in process.stdout:
+        logs.append(line)
+        yield "".join(logs)
 
     process.wait()
     if process.returncode != 0:
-        logs += f"\nProcess exited with error code: {process.returncode}"
-    yield logs
+        logs.append(f"\nProcess exited with error code: {process.returncode}")
+    yield "".join(logs)
 
 iface = gr.Interface(
     fn=run_app,
@@ -1,5 +1,3 @@
-import threading
-import time
 import traceback
 
 from sympy import true
@@ -11,34 +9,28 @@ from colors import bw, by, fb, fg, fr
 # DUCE-OLD-CLI
 
 
-def create_scraping_thread(site: str):
+progress_bars = {}
 
-    code_name = scraper_dict[site]
-    try:
-        t = threading.Thread(target=getattr(scraper, code_name), daemon=True)
-        t.start()
-
-        while getattr(scraper, f"{code_name}_length") == 0:
-            time.sleep(0.1)  # Avoid busy waiting
-        if getattr(scraper, f"{code_name}_length") == -1:
-            raise Exception(f"Error in: {site}")
-        progress_bar = tqdm(
-            total=getattr(scraper, f"{code_name}_length"), desc=site, leave=False
-        )
-        prev_progress = -1
 
-        while not getattr(scraper, f"{code_name}_done"):
-            time.sleep(0.1)
-            current_progress = getattr(scraper, f"{code_name}_progress")
-            progress_bar.update(current_progress - prev_progress)
-            prev_progress = current_progress
+def update_scraping_progress(site: str, attr: str, value):
 
-        progress_bar.update(getattr(scraper, f"{code_name}_length") - prev_progress)
-
-    except Exception:
-        error = getattr(scraper, f"{code_name}_error", traceback.format_exc())
-        print(error)
-        print("\nError in: " + site + " " + str(VERSION))
+    code_name = scraper_dict[site]
+    if attr == "length" and value > 0:
+        if site in progress_bars:
+            progress_bars[site].close()
+        progress_bars[site] = tqdm(total=value, desc=site, leave=False)
+    elif attr == "progress" and site in progress_bars:
+        progress_bar = progress_bars[site]
+        progress_bar.update(value - progress_bar.n)
+    elif attr == "done":
+        progress_bar = progress_bars.pop(site, None)
+        if progress_bar:
+            progress_bar.update(progress_bar.total - progress_bar.n)
+            progress_bar.close()
+        error = scraper.site_states[code_name].error
+        if error:
+            print(error)
+            print("\nError in: " + site + " " + str(VERSION))
 
 
 ##########################################
@@ -94,8 +86,7 @@ if not user_dumb:
     scraper = Scraper(udemy.sites)
 
 try:
-    udemy.scraped_data = scraper.get_scraped_courses(create_scraping_thread)
-    time.sleep(0.5)
+    udemy.scraped_data = scraper.get_scraped_courses(update_scraping_progress)
     print("\n")
     udemy.start_enrolling()
     udemy.print(